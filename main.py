@@ -7,10 +7,13 @@ Target: < 9.9MB file size with maximum visual quality.
 import os
 import shutil
 import subprocess
+import tempfile
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional
+from typing import Callable, Optional
 
 import customtkinter as ctk
 
@@ -25,6 +28,9 @@ class GiffyConverter:
     This class is UI-agnostic and focuses purely on file operations and subprocess management.
     """
     
+    # FPS values tried in order when the GIF exceeds the size limit
+    FPS_CASCADE = [20, 15, 10, 8, 5]
+    
     def __init__(self, input_path: str, width: str, fps: int):
         """
         Initialize the converter with input parameters.
@@ -53,12 +59,7 @@ class GiffyConverter:
         Returns:
             FFmpeg scale filter string.
         """
-        if self.width == "Original":
-            return f"fps={self.fps}"
-        else:
-            # Extract numeric width from strings like "320px (Standard)"
-            width_value = self.width.split("px")[0]
-            return f"fps={self.fps},scale={width_value}:-1:flags=lanczos"
+        return build_scale_filter(self.width, self.fps)
     
     def generate_palette(self, log_callback) -> bool:
         """
@@ -230,8 +231,7 @@ class GiffyConverter:
             log_callback("\n🔧 Auto-adjusting FPS to meet Discord limit...\n\n")
             
             # FPS reduction cascade
-            fps_options = [20, 15, 10, 8, 5]
-            for reduced_fps in fps_options:
+            for reduced_fps in self.FPS_CASCADE:
                 if reduced_fps >= self.fps:
                     continue
                 
@@ -273,10 +273,384 @@ class GiffyConverter:
         return True
 
 
+@dataclass(frozen=True)
+class PreviewEstimate:
+    """Extrapolated result of a sampled preview encode."""
+    
+    size_mb: float
+    encode_seconds: float
+    final_fps: int
+    final_size_mb: float
+    is_exact: bool
+
+
+class GiffyPreviewer:
+    """
+    Estimates final GIF size and encode time from a short sampled encode.
+    A clip from the middle of the video is encoded with the same filters as
+    GiffyConverter, then the results are scaled by the full video duration.
+    """
+    
+    SAMPLE_SECONDS = 3.0
+    
+    def __init__(self, input_path: str, width: str, fps: int):
+        """
+        Initialize the previewer with input parameters.
+        
+        Args:
+            input_path: Full path to the source MP4 file.
+            width: Target width in pixels or "Original".
+            fps: Target frames per second.
+        """
+        self.input_path = Path(input_path)
+        self.width = width
+        self.fps = fps
+        
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._process: Optional[subprocess.Popen] = None
+        self._temp_dir: Optional[Path] = None
+    
+    def probe_duration(self) -> Optional[float]:
+        """
+        Read the video duration with ffprobe.
+        
+        Returns:
+            Duration in seconds, or None if it could not be determined.
+        """
+        result = self._run_process([
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(self.input_path)
+        ])
+        if result is None:
+            return None
+        
+        try:
+            duration = float(result[1].strip())
+        except ValueError:
+            return None
+        
+        return duration if duration > 0 else None
+    
+    def estimate(self, duration: float) -> Optional[PreviewEstimate]:
+        """
+        Run the sampled encode and extrapolate it to the full conversion.
+        The encode time covers both passes of GiffyConverter.convert and,
+        when the size is over 9.9MB, every step of its FPS cascade.
+        
+        Args:
+            duration: Full video duration in seconds.
+            
+        Returns:
+            PreviewEstimate, or None if cancelled or the encode failed.
+        """
+        sample_seconds = min(self.SAMPLE_SECONDS, duration)
+        sample_args = [
+            "-ss", f"{(duration - sample_seconds) / 2:.3f}",
+            "-t", f"{sample_seconds:.3f}",
+            "-i", str(self.input_path)
+        ]
+        scale_filter = build_scale_filter(self.width, self.fps)
+        
+        with self._lock:
+            if self._cancelled:
+                return None
+            temp_dir = Path(tempfile.mkdtemp(prefix="giffydrop_preview_"))
+            self._temp_dir = temp_dir
+        
+        try:
+            palette_path = temp_dir / "palette.png"
+            sample_path = temp_dir / "sample.gif"
+            
+            # Start-up cost: process launch, seek and first decoded frame
+            overhead = self._run_timed(
+                ["ffmpeg"] + sample_args + ["-frames:v", "1", "-f", "null", "-"]
+            )
+            # Decoding alone, which every pass repeats regardless of fps
+            decode = self._run_timed(
+                ["ffmpeg"] + sample_args + ["-f", "null", "-"]
+            )
+            # The same two passes GiffyConverter runs, over the sample
+            palette = self._run_timed(
+                ["ffmpeg"] + sample_args + [
+                    "-vf", f"{scale_filter},palettegen",
+                    "-y", str(palette_path)
+                ]
+            )
+            gif = self._run_timed(
+                ["ffmpeg"] + sample_args + [
+                    "-i", str(palette_path),
+                    "-lavfi", f"{scale_filter} [x]; [x][1:v] paletteuse",
+                    "-y", str(sample_path)
+                ]
+            )
+            if None in (overhead, decode, palette, gif) or not sample_path.exists():
+                return None
+            
+            sample_mb = sample_path.stat().st_size / (1024 * 1024)
+        finally:
+            self._remove_temp_dir()
+        
+        ratio = duration / sample_seconds
+        size_mb = sample_mb * ratio
+        
+        # Start-up and decoding are paid by each pass at any fps; filtering,
+        # palette work and GIF encoding scale with the number of output frames
+        fixed_seconds = 2 * (overhead + max(decode - overhead, 0.0) * ratio)
+        frame_seconds = (max(palette - decode, 0.0) + max(gif - decode, 0.0)) * ratio
+        encode_seconds = fixed_seconds + frame_seconds
+        
+        # Mirror the FPS cascade of GiffyConverter.convert, assuming a
+        # constant size per frame
+        final_fps = self.fps
+        final_size_mb = size_mb
+        if size_mb > 9.9:
+            for reduced_fps in GiffyConverter.FPS_CASCADE:
+                if reduced_fps >= self.fps:
+                    continue
+                final_fps = reduced_fps
+                final_size_mb = size_mb * reduced_fps / self.fps
+                encode_seconds += fixed_seconds + frame_seconds * reduced_fps / self.fps
+                if final_size_mb <= 9.9:
+                    break
+        
+        return PreviewEstimate(
+            size_mb=size_mb,
+            encode_seconds=encode_seconds,
+            final_fps=final_fps,
+            final_size_mb=final_size_mb,
+            is_exact=sample_seconds >= duration
+        )
+    
+    def cancel(self):
+        """Kill the running ffmpeg/ffprobe process and remove temporary files."""
+        with self._lock:
+            self._cancelled = True
+            process = self._process
+        
+        if process is not None:
+            process.kill()
+            process.wait()
+        
+        self._remove_temp_dir()
+    
+    def _run_timed(self, cmd: list[str]) -> Optional[float]:
+        """
+        Run a command through _run_process and keep only its wall time.
+        
+        Args:
+            cmd: Command to execute.
+            
+        Returns:
+            Wall time in seconds, or None if cancelled or failed.
+        """
+        result = self._run_process(cmd)
+        return result[0] if result is not None else None
+    
+    def _run_process(self, cmd: list[str]) -> Optional[tuple[float, str]]:
+        """
+        Run an FFmpeg or ffprobe command that cancel() can kill.
+        
+        Args:
+            cmd: Command to execute.
+            
+        Returns:
+            Tuple of (wall time in seconds, stdout), or None if cancelled or failed.
+        """
+        with self._lock:
+            if self._cancelled:
+                return None
+            started = time.perf_counter()
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    universal_newlines=True,
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                )
+            except OSError:
+                return None
+            self._process = process
+        
+        output, _ = process.communicate()
+        elapsed = time.perf_counter() - started
+        
+        with self._lock:
+            self._process = None
+            if self._cancelled or process.returncode != 0:
+                return None
+        
+        return elapsed, output
+    
+    def _remove_temp_dir(self):
+        """Delete the sample directory if it still exists."""
+        with self._lock:
+            temp_dir = self._temp_dir
+            self._temp_dir = None
+        
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class PreviewEngine:
+    """
+    Runs GiffyPreviewer in the background as settings change.
+    Requests are debounced and finished estimates are cached per key.
+    A newer request kills the running encode; its partial work is
+    discarded, so returning to that setting starts a fresh encode.
+    """
+    
+    def __init__(
+        self,
+        result_callback: Callable[[tuple, Optional[PreviewEstimate]], None],
+        debounce_seconds: float = 0.4
+    ):
+        """
+        Initialize the preview engine.
+        
+        Args:
+            result_callback: Called from a worker thread with (key, estimate)
+                when the latest request finishes. estimate is None on failure.
+            debounce_seconds: Quiet period before a sampled encode starts.
+        """
+        self.result_callback = result_callback
+        self.debounce_seconds = debounce_seconds
+        self.cache: dict[tuple, PreviewEstimate] = {}
+        self.durations: dict[tuple, float] = {}
+        
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._timer: Optional[threading.Timer] = None
+        self._previewer: Optional[GiffyPreviewer] = None
+    
+    @staticmethod
+    def make_key(input_path: str, width: str, fps: int) -> tuple:
+        """
+        Build a cache key that changes when the file is re-exported.
+        
+        Args:
+            input_path: Full path to the source MP4 file.
+            width: Target width in pixels or "Original".
+            fps: Target frames per second.
+            
+        Returns:
+            Tuple of (path, mtime_ns, size_bytes, width, fps).
+            
+        Raises:
+            OSError: If the file cannot be accessed.
+        """
+        stat = os.stat(input_path)
+        return (input_path, stat.st_mtime_ns, stat.st_size, width, fps)
+    
+    def request(self, key: tuple) -> Optional[PreviewEstimate]:
+        """
+        Request an estimate for a key from make_key, superseding older requests.
+        
+        Args:
+            key: Cache key of the file and settings to preview.
+            
+        Returns:
+            The cached estimate if available, otherwise None and the result
+            is delivered later through result_callback.
+        """
+        with self._lock:
+            previewer = self._cancel_locked()
+            
+            cached = self.cache.get(key)
+            if cached is None:
+                self._timer = threading.Timer(
+                    self.debounce_seconds, self._run, args=(key, self._generation)
+                )
+                self._timer.daemon = True
+                self._timer.start()
+        
+        if previewer is not None:
+            previewer.cancel()
+        
+        return cached
+    
+    def cancel(self):
+        """Cancel any pending estimate and kill a running encode."""
+        with self._lock:
+            previewer = self._cancel_locked()
+        
+        if previewer is not None:
+            previewer.cancel()
+    
+    def _cancel_locked(self) -> Optional[GiffyPreviewer]:
+        """
+        Invalidate the current request. Caller must hold the lock.
+        
+        Returns:
+            The running previewer, to be cancelled outside the lock.
+        """
+        self._generation += 1
+        
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        previewer = self._previewer
+        self._previewer = None
+        return previewer
+    
+    def _run(self, key: tuple, generation: int):
+        """Execute a sampled encode on the debounce timer thread."""
+        input_path, mtime_ns, size_bytes, width, fps = key
+        file_key = (input_path, mtime_ns, size_bytes)
+        previewer = GiffyPreviewer(input_path, width, fps)
+        
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._previewer = previewer
+            self._timer = None
+            duration = self.durations.get(file_key)
+        
+        if duration is None:
+            duration = previewer.probe_duration()
+        
+        estimate = previewer.estimate(duration) if duration is not None else None
+        
+        with self._lock:
+            if duration is not None:
+                self.durations[file_key] = duration
+            if estimate is not None:
+                self.cache[key] = estimate
+            if generation != self._generation:
+                return
+            self._previewer = None
+        
+        self.result_callback(key, estimate)
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def build_scale_filter(width: str, fps: int) -> str:
+    """
+    Build the FFmpeg fps/scale filter chain for a width selection.
+    
+    Args:
+        width: Target width in pixels or "Original".
+        fps: Target frames per second.
+        
+    Returns:
+        FFmpeg filter string.
+    """
+    if width == "Original":
+        return f"fps={fps}"
+    else:
+        # Extract numeric width from strings like "320px (Standard)"
+        width_value = width.split("px")[0]
+        return f"fps={fps},scale={width_value}:-1:flags=lanczos"
+
+
 def check_ffmpeg() -> bool:
     """
     Check if FFmpeg is available in the system PATH.
@@ -312,10 +686,18 @@ class App(ctk.CTk):
         # State variables
         self.selected_file: Optional[str] = None
         self.is_converting: bool = False
+        self.is_closing: bool = False
+        self.preview_key: Optional[tuple] = None
+        
+        # Background size preview
+        self.preview_engine = PreviewEngine(self.on_preview_result)
         
         # Initialize UI
         self.setup_ui()
         
+        # Stop preview encodes when the window closes
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Check FFmpeg on startup
         self.after(100, self.check_ffmpeg_availability)
     
@@ -367,8 +749,8 @@ class App(ctk.CTk):
         self.file_label.pack(pady=(0, 15), padx=15)
         
         # ===== TABVIEW: "The Ezgif Control Module" =====
-        self.tabview = ctk.CTkTabview(main_frame, height=180)
-        self.tabview.pack(fill="x", pady=(0, 20))
+        self.tabview = ctk.CTkTabview(main_frame, height=180, command=self.request_preview)
+        self.tabview.pack(fill="x", pady=(0, 5))
         
         # Tab 1: Profile avatar
         self.tab_avatar = self.tabview.add("Profile avatar")
@@ -381,6 +763,16 @@ class App(ctk.CTk):
         # Set default tab
         self.tabview.set("Profile avatar")
         
+        # Live size preview for the current settings
+        self.preview_label = ctk.CTkLabel(
+            main_frame,
+            text="Select a file to preview the GIF size",
+            font=ctk.CTkFont(size=12),
+            text_color="gray60",
+            anchor="w"
+        )
+        self.preview_label.pack(fill="x", padx=5, pady=(0, 15))
+        
         # ===== ACTION AREA =====
         action_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         action_frame.pack(fill="both", expand=True)
@@ -457,6 +849,7 @@ class App(ctk.CTk):
                 "15 fps (Compact)",
                 "10 fps (Low weight)"
             ],
+            command=lambda _: self.request_preview(),
             font=ctk.CTkFont(size=12)
         )
         self.avatar_fps_dropdown.pack(fill="x", padx=20, pady=(0, 15))
@@ -502,6 +895,7 @@ class App(ctk.CTk):
                 "15 fps (Compact)",
                 "10 fps (Low weight)"
             ],
+            command=lambda _: self.request_preview(),
             font=ctk.CTkFont(size=12)
         )
         self.banner_fps_dropdown.pack(fill="x", padx=20, pady=(0, 15))
@@ -539,6 +933,7 @@ class App(ctk.CTk):
             
             self.file_label.configure(text=display_path, text_color="white")
             self.log_message(f"\n✓ File selected: {file_path}\n")
+            self.request_preview()
     
     def get_current_settings(self) -> tuple[str, int]:
         """
@@ -564,6 +959,71 @@ class App(ctk.CTk):
         
         return width, fps
     
+    def request_preview(self):
+        """Request a size estimate for the current file and settings."""
+        if not self.selected_file or self.is_converting:
+            return
+        
+        width, fps = self.get_current_settings()
+        try:
+            self.preview_key = PreviewEngine.make_key(self.selected_file, width, fps)
+        except OSError:
+            self.preview_engine.cancel()
+            self.preview_key = None
+            self.preview_label.configure(text="⚠ Size preview unavailable", text_color="gray60")
+            return
+        
+        cached = self.preview_engine.request(self.preview_key)
+        
+        if cached is not None:
+            self.show_preview(cached)
+        else:
+            self.preview_label.configure(text="⏳ Estimating size...", text_color="gray60")
+    
+    def on_preview_result(self, key: tuple, estimate: Optional[PreviewEstimate]):
+        """
+        Receive a finished estimate from the preview worker thread.
+        
+        Args:
+            key: The PreviewEngine key the estimate was computed for.
+            estimate: The estimate, or None if the sample encode failed.
+        """
+        if self.is_closing:
+            return
+        self.after(0, lambda: self.apply_preview_result(key, estimate))
+    
+    def apply_preview_result(self, key: tuple, estimate: Optional[PreviewEstimate]):
+        """Show an estimate if it still matches the current settings."""
+        if self.is_closing or self.is_converting or key != self.preview_key:
+            return
+        
+        if estimate is None:
+            self.preview_label.configure(text="⚠ Size preview unavailable", text_color="gray60")
+        else:
+            self.show_preview(estimate)
+    
+    def show_preview(self, estimate: PreviewEstimate):
+        """
+        Display an estimate next to the controls.
+        
+        Args:
+            estimate: The estimate to display.
+        """
+        prefix = "" if estimate.is_exact else "~"
+        text = (
+            f"📊 Estimated size: {prefix}{estimate.size_mb:.2f} MB"
+            f"  •  Encode time: ~{estimate.encode_seconds:.0f}s"
+        )
+        
+        if estimate.final_size_mb > 9.9:
+            text += f"  (over 9.9MB even at {estimate.final_fps} fps)"
+            self.preview_label.configure(text=text, text_color="orange")
+        elif estimate.size_mb > 9.9:
+            text += f"  (over 9.9MB, auto-adjusts to {estimate.final_fps} fps)"
+            self.preview_label.configure(text=text, text_color="orange")
+        else:
+            self.preview_label.configure(text=text, text_color="#51cf66")
+    
     def log_message(self, message: str):
         """
         Add a message to the status log.
@@ -607,8 +1067,10 @@ class App(ctk.CTk):
             )
             return
         
-        # Disable UI during conversion
+        # Disable UI during conversion and free the CPU from preview encodes
         self.is_converting = True
+        self.preview_engine.cancel()
+        self.preview_label.configure(text="Preview paused during conversion", text_color="gray60")
         self.convert_button.configure(state="disabled", text="Converting...")
         self.select_button.configure(state="disabled")
         
@@ -658,6 +1120,13 @@ class App(ctk.CTk):
             self.is_converting = False
             self.after(0, lambda: self.convert_button.configure(state="normal", text="🎯 Convert to GIF"))
             self.after(0, lambda: self.select_button.configure(state="normal"))
+            self.after(0, self.request_preview)
+    
+    def on_close(self):
+        """Kill background previews and close the window."""
+        self.is_closing = True
+        self.preview_engine.cancel()
+        self.destroy()
 
 
 # ============================================================================